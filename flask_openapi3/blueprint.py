@@ -1,7 +1,7 @@
 # -*- coding: utf-8 -*-
 # @Author  : llc
 # @Time    : 2022/4/1 16:54
-from typing import Optional, List, Dict, Any, Callable
+from typing import Optional, List, Dict, Any, Callable, Set
 
 from flask import Blueprint
 
@@ -57,7 +57,7 @@ class APIBlueprint(APIScaffold, Blueprint):
         self.paths: Dict = dict()
         self.components_schemas: Dict = dict()
         self.tags: List[Tag] = []
-        self.tag_names: List[str] = []
+        self.tag_names: Set[str] = set()
 
         # Set values from arguments or default values
         self.abp_tags = abp_tags or []
@@ -82,6 +82,7 @@ class APIBlueprint(APIScaffold, Blueprint):
         for tag in api.tags:
             if tag.name not in self.tag_names:
                 self.tags.append(tag)
+                self.tag_names.add(tag.name)
 
         # Merge paths from the nested APIBlueprint
         for path_url, path_item in api.paths.items():
@@ -143,11 +144,12 @@ class APIBlueprint(APIScaffold, Blueprint):
             doc_ui: Declares this operation to be shown. Default to True.
         """
         if self.doc_ui is True and doc_ui is True:
-            # Convert key to string
-            new_responses = convert_responses_key_to_string(responses or {})
-
-            # Global response: combine API responses
-            combine_responses = {**self.abp_responses, **new_responses}
+            # Global response: combine API responses, the global ones are shared when there is nothing to add
+            if responses:
+                # Convert key to string
+                combine_responses = {**self.abp_responses, **convert_responses_key_to_string(responses)}
+            else:
+                combine_responses = self.abp_responses
 
             # Create operation
             operation = get_operation(
@@ -2,10 +2,11 @@
 # @Author  : llc
 # @Time    : 2021/4/30 14:25
 import os
-import re
 import sys
+import warnings
+from functools import lru_cache
 from importlib import import_module
-from typing import Optional, List, Dict, Union, Any, Type, Callable
+from typing import Optional, List, Dict, Union, Any, Type, Callable, Set
 
 from flask import Flask, Blueprint, render_template_string
 from pydantic import BaseModel
@@ -27,7 +28,6 @@ from .models import Server
 from .models import Tag
 from .models import ValidationErrorModel
 from .scaffold import APIScaffold
-from .templates import openapi_html_string
 from .types import ParametersTuple
 from .types import ResponseDict
 from .types import SecuritySchemesDict
@@ -42,9 +42,24 @@ from .utils import make_validation_error_response
 from .utils import parse_and_store_tags
 from .utils import parse_method
 from .utils import parse_parameters
+from .utils import parse_rule
 from .view import APIView
 
 
+@lru_cache(maxsize=None)
+def _get_validation_error_schemas(validation_error_model: Type[BaseModel]) -> Dict[str, Schema]:
+    """Build the components schemas of a validation error model only once."""
+    schema = get_model_schema(validation_error_model)
+    schemas = {validation_error_model.__name__: Schema(**schema)}
+
+    # Parse definitions
+    definitions = schema.get("$defs", {})
+    for name, value in definitions.items():
+        schemas[name] = Schema(**value)
+
+    return schemas
+
+
 class OpenAPI(APIScaffold, Flask):
     def __init__(
             self,
@@ -116,14 +131,14 @@ class OpenAPI(APIScaffold, Flask):
 
         # Initialize lists for tags and tag names
         self.tags: List[Tag] = []
-        self.tag_names: List[str] = []
+        self.tag_names: Set[str] = set()
 
         # Set URL prefixes and endpoints
         self.doc_prefix = doc_prefix
         self.doc_url = doc_url
 
         # Set servers and external documentation
-        self.severs = servers
+        self.servers = servers
         self.external_docs = external_docs
 
         # Set the operation ID callback function
@@ -146,16 +161,31 @@ class OpenAPI(APIScaffold, Flask):
 
         # Initialize specification JSON
         self.spec_json: Dict = {}
+        # Rebuild specification JSON only after the registered APIs have changed
+        self._spec_dirty = True
         self.spec = APISpec(
             openapi=self.openapi_version,
             info=self.info,
             paths=self.paths
         )
 
+    @property
+    def severs(self) -> Optional[List[Server]]:
+        """Deprecated alias of `servers`."""
+        warnings.warn("`severs` is deprecated, use `servers` instead.", DeprecationWarning, stacklevel=2)
+        return self.servers
+
+    @severs.setter
+    def severs(self, servers: Optional[List[Server]]) -> None:
+        warnings.warn("`severs` is deprecated, use `servers` instead.", DeprecationWarning, stacklevel=2)
+        self.servers = servers
+
     def _init_doc(self) -> None:
         """
         Provide Swagger UI, Redoc, and Rapidoc
         """
+        from .templates import openapi_html_string
+
         _here = os.path.dirname(__file__)
         template_folder = os.path.join(_here, "templates")
         static_folder = os.path.join(template_folder, "static")
@@ -177,6 +207,7 @@ class OpenAPI(APIScaffold, Flask):
         )
 
         ui_templates = []
+        doc_url = self.doc_url.lstrip("/")
         # Iterate over all entry points in the "flask_openapi3.plugins" group
         for entry_point in entry_points(group="flask_openapi3.plugins"):
             try:
@@ -187,7 +218,7 @@ class OpenAPI(APIScaffold, Flask):
                 plugin_register = plugin_class.register
                 plugin_name = plugin_class.name
                 plugin_display_name = plugin_class.display_name
-                bp = plugin_register(doc_url=self.doc_url.lstrip("/"))
+                bp = plugin_register(doc_url=doc_url)
                 self.register_blueprint(bp, url_prefix=self.doc_prefix)
                 ui_templates.append({"name": plugin_name, "display_name": plugin_display_name})
             except (ModuleNotFoundError, AttributeError):  # pragma: no cover
@@ -195,14 +226,24 @@ class OpenAPI(APIScaffold, Flask):
                 print(f"Warning: plugin '{entry_point.value}' registration failed.")
                 traceback.print_exc()
 
+        # The built-in home page only depends on ui_templates, so it is rendered once and reused
+        rendered_html_string: Optional[str] = None
+
+        def openapi_html():
+            nonlocal rendered_html_string
+            html_string = self.config.get("OPENAPI_HTML_STRING")
+            if html_string:
+                # A custom template may depend on the request, render it every time
+                return render_template_string(html_string, ui_templates=ui_templates)
+            if rendered_html_string is None:
+                rendered_html_string = render_template_string(openapi_html_string, ui_templates=ui_templates)
+            return rendered_html_string
+
         # Add URL rule for the home page
         blueprint.add_url_rule(
             rule="/",
             endpoint="openapi",
-            view_func=lambda: render_template_string(
-                self.config.get("OPENAPI_HTML_STRING") or openapi_html_string,
-                ui_templates=ui_templates
-            )
+            view_func=openapi_html
         )
 
         # Register the blueprint with the Flask application
@@ -217,7 +258,7 @@ class OpenAPI(APIScaffold, Flask):
             The OpenAPI specification JSON as a dictionary.
 
         """
-        if self.spec_json:
+        if self.spec_json and not self._spec_dirty:
             return self.spec_json
 
         self.generate_spec_json()
@@ -229,8 +270,8 @@ class OpenAPI(APIScaffold, Flask):
         self.spec.info = self.info
         self.spec.paths = self.paths
 
-        if self.severs:
-            self.spec.servers = self.severs
+        if self.servers:
+            self.spec.servers = self.servers
 
         if self.external_docs:
             self.spec.externalDocs = self.external_docs
@@ -239,15 +280,6 @@ class OpenAPI(APIScaffold, Flask):
         if self.tags:
             self.spec.tags = self.tags
 
-        # Add ValidationErrorModel to components schemas
-        schema = get_model_schema(self.validation_error_model)
-        self.components_schemas[self.validation_error_model.__name__] = Schema(**schema)
-
-        # Parse definitions
-        definitions = schema.get("$defs", {})
-        for name, value in definitions.items():
-            self.components_schemas[name] = Schema(**value)
-
         # Set components
         self.components.schemas = self.components_schemas
         self.components.securitySchemes = self.security_schemes
@@ -256,30 +288,42 @@ class OpenAPI(APIScaffold, Flask):
         # Convert spec to JSON
         self.spec_json = self.spec.model_dump(mode="json", by_alias=True, exclude_unset=True, warnings=False)
 
+        # Add ValidationErrorModel to components schemas, dumped per build since the spec is public and mutable
+        validation_error_model = self.validation_error_model
+        components_schemas = self.spec_json["components"].setdefault("schemas", {})
+        for name, value in _get_validation_error_schemas(validation_error_model).items():
+            components_schemas[name] = value.model_dump(
+                mode="json", by_alias=True, exclude_unset=True, warnings=False
+            )
+
         # Update with OpenAPI extensions
-        self.spec_json.update(**self.openapi_extensions)
+        self.spec_json.update(self.openapi_extensions)
 
         # Handle validation error response
-        for rule, path_item in self.spec_json["paths"].items():
-            for http_method, operation in path_item.items():
+        validation_error_status = self.validation_error_status
+        validation_error_description = HTTP_STATUS.get(validation_error_status, "")
+        validation_error_ref = f"{OPENAPI3_REF_PREFIX}/{validation_error_model.__name__}"
+        for path_item in self.spec_json["paths"].values():
+            for operation in path_item.values():
                 if operation.get("parameters") is None and operation.get("requestBody") is None:
                     continue
-                if not operation.get("responses"):
-                    operation["responses"] = {}
-                if operation["responses"].get(self.validation_error_status):
+                responses = operation.setdefault("responses", {})
+                if validation_error_status in responses:
                     continue
-                operation["responses"][self.validation_error_status] = {
-                    "description": HTTP_STATUS[self.validation_error_status],
+                responses[validation_error_status] = {
+                    "description": validation_error_description,
                     "content": {
                         "application/json": {
                             "schema": {
                                 "type": "array",
-                                "items": {"$ref": f"{OPENAPI3_REF_PREFIX}/{self.validation_error_model.__name__}"}
+                                "items": {"$ref": validation_error_ref}
                             }
                         }
                     }
                 }
 
+        self._spec_dirty = False
+
     def register_api(self, api: APIBlueprint) -> None:
         """
         Register an APIBlueprint.
@@ -293,18 +337,20 @@ class OpenAPI(APIScaffold, Flask):
                 # Append tag to the list of tags
                 self.tags.append(tag)
 
-                # Append tag name to the list of tag names
-                self.tag_names.append(tag.name)
+                # Add tag name to the set of tag names
+                self.tag_names.add(tag.name)
 
         # Update paths with the APIBlueprint's paths
-        self.paths.update(**api.paths)
+        self.paths.update(api.paths)
 
         # Update component schemas with the APIBlueprint's component schemas
-        self.components_schemas.update(**api.components_schemas)
+        self.components_schemas.update(api.components_schemas)
 
         # Register the APIBlueprint with the current instance
         self.register_blueprint(api)
 
+        self._spec_dirty = True
+
     def register_api_view(self, api_view: APIView, view_kwargs: Optional[Dict[Any, Any]] = None) -> None:
         """
         Register APIView
@@ -322,18 +368,20 @@ class OpenAPI(APIScaffold, Flask):
                 # Append tag to the list of tags
                 self.tags.append(tag)
 
-                # Append tag name to the list of tag names
-                self.tag_names.append(tag.name)
+                # Add tag name to the set of tag names
+                self.tag_names.add(tag.name)
 
         # Update paths with the APIView's paths
-        self.paths.update(**api_view.paths)
+        self.paths.update(api_view.paths)
 
         # Update component schemas with the APIView's component schemas
-        self.components_schemas.update(**api_view.components_schemas)
+        self.components_schemas.update(api_view.components_schemas)
 
         # Register the APIView with the current instance
         api_view.register(self, view_kwargs=view_kwargs)
 
+        self._spec_dirty = True
+
     def _add_url_rule(
             self,
             rule,
@@ -382,11 +430,12 @@ class OpenAPI(APIScaffold, Flask):
             method: HTTP method for the operation. Defaults to GET.
         """
         if doc_ui is True:
-            # Convert key to string
-            new_responses = convert_responses_key_to_string(responses or {})
-
-            # Global response: combine API responses
-            combine_responses = {**self.responses, **new_responses}
+            # Global response: combine API responses, the global ones are shared when there is nothing to add
+            if responses:
+                # Convert key to string
+                combine_responses = {**self.responses, **convert_responses_key_to_string(responses)}
+            else:
+                combine_responses = self.responses
 
             # Create operation
             operation = get_operation(
@@ -423,11 +472,13 @@ class OpenAPI(APIScaffold, Flask):
             get_responses(combine_responses, self.components_schemas, operation)
 
             # Convert a route parameter format from /pet/<petId> to /pet/{petId}
-            uri = re.sub(r"<([^<:]+:)?", "{", rule).replace(">", "}")
+            uri = parse_rule(rule)
 
             # Parse method
             parse_method(uri, method, self.paths, operation)
 
+            self._spec_dirty = True
+
             # Parse parameters
             return parse_parameters(func, components_schemas=self.components_schemas, operation=operation)
         else:
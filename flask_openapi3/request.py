@@ -2,6 +2,7 @@
 # @Author  : llc
 # @Time    : 2022/4/1 16:54
 import json
+from functools import lru_cache
 from json import JSONDecodeError
 from typing import Any, Type, Optional, Dict
 
@@ -11,6 +12,12 @@ from pydantic.fields import FieldInfo
 from werkzeug.datastructures.structures import MultiDict
 
 
+@lru_cache(maxsize=None)
+def _get_model_properties(model: Type[BaseModel]) -> Any:
+    """Returns the JSON schema properties of a model, they are the same for every request."""
+    return model.model_json_schema().get("properties", {})
+
+
 def _get_list_value(model: Type[BaseModel], args: MultiDict, model_field_key: str, model_field_value: FieldInfo):
     if model_field_value.alias and model.model_config.get("populate_by_name"):
         key = model_field_value.alias
@@ -42,11 +49,12 @@ def _get_value(model: Type[BaseModel], args: MultiDict, model_field_key: str, mo
 def _validate_header(header: Type[BaseModel], func_kwargs: dict):
     request_headers = dict(request.headers)
     header_dict = {}
-    model_properties = header.model_json_schema().get("properties", {})
+    model_properties = _get_model_properties(header)
+    populate_by_name = header.model_config.get("populate_by_name")
     for model_field_key, model_field_value in header.model_fields.items():
         key_title = model_field_key.replace("_", "-").title()
         model_field_schema = model_properties.get(model_field_value.alias or model_field_key)
-        if model_field_value.alias and header.model_config.get("populate_by_name"):
+        if model_field_value.alias and populate_by_name:
             key = model_field_value.alias
             key_alias_title = model_field_value.alias.replace("_", "-").title()
             value = request_headers.get(key_alias_title) or request_headers.get(key_title)
@@ -63,7 +71,7 @@ def _validate_header(header: Type[BaseModel], func_kwargs: dict):
             header_dict[key] = value  # type:ignore
     # extra keys
     for key, value in request_headers.items():
-        if key not in header_dict.keys():
+        if key not in header_dict:
             header_dict[key] = value
     func_kwargs["header"] = header.model_validate(obj=header_dict)
 
@@ -80,7 +88,7 @@ def _validate_path(path: Type[BaseModel], path_kwargs: dict, func_kwargs: dict):
 def _validate_query(query: Type[BaseModel], func_kwargs: dict):
     request_args = request.args
     query_dict = {}
-    model_properties = query.model_json_schema().get("properties", {})
+    model_properties = _get_model_properties(query)
     for model_field_key, model_field_value in query.model_fields.items():
         model_field_schema = model_properties.get(model_field_value.alias or model_field_key)
         if model_field_schema.get("type") == "array":
@@ -93,7 +101,7 @@ def _validate_query(query: Type[BaseModel], func_kwargs: dict):
             query_dict[key] = value
     # extra keys
     for key, value in request_args.items():
-        if key not in query_dict.keys():
+        if key not in query_dict:
             query_dict[key] = value
     func_kwargs["query"] = query.model_validate(obj=query_dict)
 
@@ -102,7 +110,7 @@ def _validate_form(form: Type[BaseModel], func_kwargs: dict):
     request_form = request.form
     request_files = request.files
     form_dict = {}
-    model_properties = form.model_json_schema().get("properties", {})
+    model_properties = _get_model_properties(form)
     for model_field_key, model_field_value in form.model_fields.items():
         model_field_schema = model_properties.get(model_field_value.alias or model_field_key)
         if model_field_schema.get("type") == "array":
@@ -132,7 +140,7 @@ def _validate_form(form: Type[BaseModel], func_kwargs: dict):
             form_dict[key] = value
     # extra keys
     for key, value in {**dict(request_form), **dict(request_files)}.items():
-        if key not in form_dict.keys():
+        if key not in form_dict:
             form_dict[key] = value
     func_kwargs["form"] = form.model_validate(obj=form_dict)
 
@@ -2,8 +2,9 @@
 # @Author  : llc
 # @Time    : 2022/8/30 9:40
 import inspect
+from functools import partial
 from functools import wraps
-from typing import Callable, List, Optional, Dict, Any
+from typing import Callable, List, Optional, Dict, Any, Tuple
 
 from flask.wrappers import Response as FlaskResponse
 
@@ -15,6 +16,9 @@ from .types import ParametersTuple
 from .types import ResponseDict
 from .utils import HTTPMethod
 
+# One shared `methods` tuple per HTTP method for the URL rules
+_METHODS: Dict[str, Tuple[str, ...]] = {method: (method,) for method in HTTPMethod}
+
 
 class APIScaffold:
     def _collect_openapi_info(
@@ -63,29 +67,32 @@ class APIScaffold:
             view_class=None,
             view_kwargs=None
     ):
+        # Bind the request models once instead of passing them on every request
+        validate_request = partial(
+            _validate_request,
+            header=header,
+            cookie=cookie,
+            path=path,
+            query=query,
+            form=form,
+            body=body,
+            raw=raw
+        )
+
+        # Resolve how to instantiate the view class once instead of on every request
+        view_class_kwargs = {}
+        if view_class and inspect.signature(view_class.__init__).parameters.get("view_kwargs"):
+            view_class_kwargs["view_kwargs"] = view_kwargs
+
         is_coroutine_function = inspect.iscoroutinefunction(func)
         if is_coroutine_function:
             @wraps(func)
             async def view_func(**kwargs) -> FlaskResponse:
-                func_kwargs = _validate_request(
-                    header=header,
-                    cookie=cookie,
-                    path=path,
-                    query=query,
-                    form=form,
-                    body=body,
-                    raw=raw,
-                    path_kwargs=kwargs
-                )
+                func_kwargs = validate_request(path_kwargs=kwargs)
 
                 # handle async request
                 if view_class:
-                    signature = inspect.signature(view_class.__init__)
-                    parameters = signature.parameters
-                    if parameters.get("view_kwargs"):
-                        view_object = view_class(view_kwargs=view_kwargs)
-                    else:
-                        view_object = view_class()
+                    view_object = view_class(**view_class_kwargs)
                     response = await func(view_object, **func_kwargs)
                 else:
                     response = await func(**func_kwargs)
@@ -93,25 +100,11 @@ class APIScaffold:
         else:
             @wraps(func)
             def view_func(**kwargs) -> FlaskResponse:
-                func_kwargs = _validate_request(
-                    header=header,
-                    cookie=cookie,
-                    path=path,
-                    query=query,
-                    form=form,
-                    body=body,
-                    raw=raw,
-                    path_kwargs=kwargs
-                )
+                func_kwargs = validate_request(path_kwargs=kwargs)
 
                 # handle request
                 if view_class:
-                    signature = inspect.signature(view_class.__init__)
-                    parameters = signature.parameters
-                    if parameters.get("view_kwargs"):
-                        view_object = view_class(view_kwargs=view_kwargs)
-                    else:
-                        view_object = view_class()
+                    view_object = view_class(**view_class_kwargs)
                     response = func(view_object, **func_kwargs)
                 else:
                     response = func(**func_kwargs)
@@ -122,8 +115,9 @@ class APIScaffold:
 
         return func.view
 
-    def get(
+    def _method_decorator(
             self,
+            method: str,
             rule: str,
             *,
             tags: Optional[List[Tag]] = None,
@@ -139,24 +133,9 @@ class APIScaffold:
             doc_ui: bool = True,
             **options: Any
     ) -> Callable:
-        """
-        Decorator for defining a REST API endpoint with the HTTP GET method.
-        More information goto https://spec.openapis.org/oas/v3.1.0#operation-object
-
-        Args:
-            rule: The URL rule string.
-            tags: Adds metadata to a single tag.
-            summary: A short summary of what the operation does.
-            description: A verbose explanation of the operation behavior.
-            external_docs: Additional external documentation for this operation.
-            operation_id: Unique string used to identify the operation.
-            responses: API responses should be either a subclass of BaseModel, a dictionary, or None.
-            deprecated: Declares this operation to be deprecated.
-            security: A declaration of which security mechanisms can be used for this operation.
-            servers: An alternative server array to service this operation.
-            openapi_extensions: Allows extensions to the OpenAPI Schema.
-            doc_ui: Declares this operation to be shown. Default to True.
-        """
+        """Shared implementation of the get, post, put, delete and patch decorators."""
+        # options is a fresh dict for every decorator, the method always overrides `methods`
+        options["methods"] = _METHODS[method]
 
         def decorator(func) -> Callable:
             header, cookie, path, query, form, body, raw = \
@@ -174,18 +153,17 @@ class APIScaffold:
                     servers=servers,
                     openapi_extensions=openapi_extensions,
                     doc_ui=doc_ui,
-                    method=HTTPMethod.GET
+                    method=method
                 )
 
             view_func = self.create_view_func(func, header, cookie, path, query, form, body, raw)
-            options.update({"methods": [HTTPMethod.GET]})
             self._add_url_rule(rule, view_func=view_func, **options)
 
             return func
 
         return decorator
 
-    def post(
+    def get(
             self,
             rule: str,
             *,
@@ -203,7 +181,7 @@ class APIScaffold:
             **options: Any
     ) -> Callable:
         """
-        Decorator for defining a REST API endpoint with the HTTP POST method.
+        Decorator for defining a REST API endpoint with the HTTP GET method.
         More information goto https://spec.openapis.org/oas/v3.1.0#operation-object
 
         Args:
@@ -221,32 +199,75 @@ class APIScaffold:
             doc_ui: Declares this operation to be shown. Default to True.
         """
 
-        def decorator(func) -> Callable:
-            header, cookie, path, query, form, body, raw = \
-                self._collect_openapi_info(
-                    rule,
-                    func,
-                    tags=tags,
-                    summary=summary,
-                    description=description,
-                    external_docs=external_docs,
-                    operation_id=operation_id,
-                    responses=responses,
-                    deprecated=deprecated,
-                    security=security,
-                    servers=servers,
-                    openapi_extensions=openapi_extensions,
-                    doc_ui=doc_ui,
-                    method=HTTPMethod.POST
-                )
+        return self._method_decorator(
+            HTTPMethod.GET,
+            rule,
+            tags=tags,
+            summary=summary,
+            description=description,
+            external_docs=external_docs,
+            operation_id=operation_id,
+            responses=responses,
+            deprecated=deprecated,
+            security=security,
+            servers=servers,
+            openapi_extensions=openapi_extensions,
+            doc_ui=doc_ui,
+            **options
+        )
 
-            view_func = self.create_view_func(func, header, cookie, path, query, form, body, raw)
-            options.update({"methods": [HTTPMethod.POST]})
-            self._add_url_rule(rule, view_func=view_func, **options)
+    def post(
+            self,
+            rule: str,
+            *,
+            tags: Optional[List[Tag]] = None,
+            summary: Optional[str] = None,
+            description: Optional[str] = None,
+            external_docs: Optional[ExternalDocumentation] = None,
+            operation_id: Optional[str] = None,
+            responses: Optional[ResponseDict] = None,
+            deprecated: Optional[bool] = None,
+            security: Optional[List[Dict[str, List[Any]]]] = None,
+            servers: Optional[List[Server]] = None,
+            openapi_extensions: Optional[Dict[str, Any]] = None,
+            doc_ui: bool = True,
+            **options: Any
+    ) -> Callable:
+        """
+        Decorator for defining a REST API endpoint with the HTTP POST method.
+        More information goto https://spec.openapis.org/oas/v3.1.0#operation-object
 
-            return func
+        Args:
+            rule: The URL rule string.
+            tags: Adds metadata to a single tag.
+            summary: A short summary of what the operation does.
+            description: A verbose explanation of the operation behavior.
+            external_docs: Additional external documentation for this operation.
+            operation_id: Unique string used to identify the operation.
+            responses: API responses should be either a subclass of BaseModel, a dictionary, or None.
+            deprecated: Declares this operation to be deprecated.
+            security: A declaration of which security mechanisms can be used for this operation.
+            servers: An alternative server array to service this operation.
+            openapi_extensions: Allows extensions to the OpenAPI Schema.
+            doc_ui: Declares this operation to be shown. Default to True.
+        """
 
-        return decorator
+        return self._method_decorator(
+            HTTPMethod.POST,
+            rule,
+            tags=tags,
+            summary=summary,
+            description=description,
+            external_docs=external_docs,
+            operation_id=operation_id,
+            responses=responses,
+            deprecated=deprecated,
+            security=security,
+            servers=servers,
+            openapi_extensions=openapi_extensions,
+            doc_ui=doc_ui,
+            **options
+        )
 
     def put(
             self,
@@ -284,32 +305,22 @@ class APIScaffold:
             doc_ui: Declares this operation to be shown. Default to True.
         """
 
-        def decorator(func) -> Callable:
-            header, cookie, path, query, form, body, raw = \
-                self._collect_openapi_info(
-                    rule,
-                    func,
-                    tags=tags,
-                    summary=summary,
-                    description=description,
-                    external_docs=external_docs,
-                    operation_id=operation_id,
-                    responses=responses,
-                    deprecated=deprecated,
-                    security=security,
-                    servers=servers,
-                    openapi_extensions=openapi_extensions,
-                    doc_ui=doc_ui,
-                    method=HTTPMethod.PUT
-                )
-
-            view_func = self.create_view_func(func, header, cookie, path, query, form, body, raw)
-            options.update({"methods": [HTTPMethod.PUT]})
-            self._add_url_rule(rule, view_func=view_func, **options)
-
-            return func
-
-        return decorator
+        return self._method_decorator(
+            HTTPMethod.PUT,
+            rule,
+            tags=tags,
+            summary=summary,
+            description=description,
+            external_docs=external_docs,
+            operation_id=operation_id,
+            responses=responses,
+            deprecated=deprecated,
+            security=security,
+            servers=servers,
+            openapi_extensions=openapi_extensions,
+            doc_ui=doc_ui,
+            **options
+        )
 
     def delete(
             self,
@@ -347,32 +358,22 @@ class APIScaffold:
             doc_ui: Declares this operation to be shown. Default to True.
         """
 
-        def decorator(func) -> Callable:
-            header, cookie, path, query, form, body, raw = \
-                self._collect_openapi_info(
-                    rule,
-                    func,
-                    tags=tags,
-                    summary=summary,
-                    description=description,
-                    external_docs=external_docs,
-                    operation_id=operation_id,
-                    responses=responses,
-                    deprecated=deprecated,
-                    security=security,
-                    servers=servers,
-                    openapi_extensions=openapi_extensions,
-                    doc_ui=doc_ui,
-                    method=HTTPMethod.DELETE
-                )
-
-            view_func = self.create_view_func(func, header, cookie, path, query, form, body, raw)
-            options.update({"methods": [HTTPMethod.DELETE]})
-            self._add_url_rule(rule, view_func=view_func, **options)
-
-            return func
-
-        return decorator
+        return self._method_decorator(
+            HTTPMethod.DELETE,
+            rule,
+            tags=tags,
+            summary=summary,
+            description=description,
+            external_docs=external_docs,
+            operation_id=operation_id,
+            responses=responses,
+            deprecated=deprecated,
+            security=security,
+            servers=servers,
+            openapi_extensions=openapi_extensions,
+            doc_ui=doc_ui,
+            **options
+        )
 
     def patch(
             self,
@@ -410,29 +411,19 @@ class APIScaffold:
             doc_ui: Declares this operation to be shown. Default to True.
         """
 
-        def decorator(func) -> Callable:
-            header, cookie, path, query, form, body, raw = \
-                self._collect_openapi_info(
-                    rule,
-                    func,
-                    tags=tags,
-                    summary=summary,
-                    description=description,
-                    external_docs=external_docs,
-                    operation_id=operation_id,
-                    responses=responses,
-                    deprecated=deprecated,
-                    security=security,
-                    servers=servers,
-                    openapi_extensions=openapi_extensions,
-                    doc_ui=doc_ui,
-                    method=HTTPMethod.PATCH
-                )
-
-            view_func = self.create_view_func(func, header, cookie, path, query, form, body, raw)
-            options.update({"methods": [HTTPMethod.PATCH]})
-            self._add_url_rule(rule, view_func=view_func, **options)
-
-            return func
-
-        return decorator
+        return self._method_decorator(
+            HTTPMethod.PATCH,
+            rule,
+            tags=tags,
+            summary=summary,
+            description=description,
+            external_docs=external_docs,
+            operation_id=operation_id,
+            responses=responses,
+            deprecated=deprecated,
+            security=security,
+            servers=servers,
+            openapi_extensions=openapi_extensions,
+            doc_ui=doc_ui,
+            **options
+        )
@@ -6,8 +6,10 @@ import inspect
 import re
 import sys
 from enum import Enum
+from functools import lru_cache
 from http import HTTPStatus
-from typing import get_type_hints, Dict, Type, Callable, List, Tuple, Optional, Any, DefaultDict
+from weakref import WeakKeyDictionary
+from typing import get_type_hints, Dict, Type, Callable, List, Tuple, Optional, Any, DefaultDict, Set
 
 from flask import make_response, current_app
 from flask.wrappers import Response as FlaskResponse
@@ -34,6 +36,18 @@ from .types import ResponseStrKeyDict
 
 HTTP_STATUS = {str(status.value): status.phrase for status in HTTPStatus}
 
+# Matches the opening of a route parameter, such as `<` or `<int:`
+_RULE_PARAM_RE = re.compile(r"<([^<:]+:)?")
+
+# Matches the characters that are not allowed in an operation ID
+_NON_WORD_RE = re.compile(r"\W")
+
+# Matches the characters that are not allowed in a component name
+_INVALID_NAME_CHAR_RE = re.compile(r"[^\w.\-]")
+
+# Parameter types of view functions, a function may be registered for several methods and rules
+_parameter_types_cache: "WeakKeyDictionary[Callable, ParametersTuple]" = WeakKeyDictionary()
+
 if sys.version_info < (3, 11):  # pragma: no cover
 
     class HTTPMethod(str, Enum):
@@ -50,6 +64,16 @@ else:
     from http import HTTPMethod
 
 
+# PathItem attributes of the HTTP methods that can be documented
+_PATH_ITEM_METHOD_ATTRS: Dict[str, str] = {
+    HTTPMethod.GET: "get",
+    HTTPMethod.POST: "post",
+    HTTPMethod.PUT: "put",
+    HTTPMethod.PATCH: "patch",
+    HTTPMethod.DELETE: "delete",
+}
+
+
 def get_operation(
         func: Callable, *,
         summary: Optional[str] = None,
@@ -69,20 +93,21 @@ def get_operation(
         An Operation object representing the operation.
 
     """
-    # Get the docstring of the function
-    doc = inspect.getdoc(func) or ""
-    doc = doc.strip()
-    lines = doc.split("\n")
-    doc_summary = lines[0]
-
-    # Determine the summary and description based on provided arguments or docstring
-    if summary is None:
-        doc_description = lines[0] if len(lines) == 0 else "</br>".join(lines[1:])
-    else:
-        doc_description = "</br>".join(lines)
+    # The docstring is only needed when the summary or the description is not provided
+    if not summary or not description:
+        # Get the docstring of the function
+        doc = inspect.getdoc(func) or ""
+        lines = doc.strip().splitlines() or [""]
+        doc_summary = lines[0]
+
+        # Determine the summary and description based on provided arguments or docstring
+        if summary is None:
+            doc_description = "</br>".join(lines[1:])
+        else:
+            doc_description = "</br>".join(lines)
 
-    summary = summary or doc_summary
-    description = description or doc_description
+        summary = summary or doc_summary
+        description = description or doc_description
 
     # Create the operation dictionary with summary and description
     operation_dict = {}
@@ -94,7 +119,8 @@ def get_operation(
         operation_dict["description"] = description  # type: ignore
 
     # Add any additional openapi_extensions to the operation dictionary
-    operation_dict.update(openapi_extensions or {})
+    if openapi_extensions:
+        operation_dict.update(openapi_extensions)
 
     # Create and return the Operation object
     operation = Operation(**operation_dict)
@@ -116,151 +142,106 @@ def get_operation_id_for_path(*, name: str, path: str, method: str) -> str:
 
     """
 
-    return re.sub(r"\W", "_", name + path) + "_" + method.lower()
+    return _NON_WORD_RE.sub("_", name + path) + "_" + method.lower()
 
 
 def get_model_schema(model: Type[BaseModel], mode: JsonSchemaMode = "validation") -> dict:
-    """Converts a Pydantic model to an OpenAPI schema."""
+    """
+    Converts a Pydantic model to an OpenAPI schema.
+    The schema is cached for each model and mode, so the returned dict must not be modified.
+    """
 
     assert inspect.isclass(model) and issubclass(model, BaseModel), \
         f"{model} is invalid `pydantic.BaseModel`"
 
+    return _get_model_schema(model, mode)
+
+
+@lru_cache(maxsize=None)
+def _get_model_schema(model: Type[BaseModel], mode: JsonSchemaMode) -> dict:
     model_config = model.model_config
     by_alias = bool(model_config.get("by_alias", True))
 
     return model.model_json_schema(by_alias=by_alias, ref_template=OPENAPI3_REF_TEMPLATE, mode=mode)
 
 
-def parse_header(header: Type[BaseModel]) -> Tuple[List[Parameter], dict]:
-    """Parses a header model and returns a list of parameters and component schemas."""
-    schema = get_model_schema(header)
-    parameters = []
-    components_schemas: Dict = dict()
-    properties = schema.get("properties", {})
-
-    for name, value in properties.items():
-        data = {
-            "name": name,
-            "in": ParameterInType.HEADER,
-            "required": name in schema.get("required", []),
-            "schema": Schema(**value)
-        }
-        # Parse extra values
-        if "description" in value.keys():
-            data["description"] = value.get("description")
-        if "deprecated" in value.keys():
-            data["deprecated"] = value.get("deprecated")
-        if "example" in value.keys():
-            data["example"] = value.get("example")
-        if "examples" in value.keys():
-            data["examples"] = value.get("examples")
-        parameters.append(Parameter(**data))
+@lru_cache(maxsize=None)
+def _get_model_definitions(model: Type[BaseModel], mode: JsonSchemaMode) -> Dict[str, Schema]:
+    """Parses the definitions of a model schema once, the same models are often used by many routes."""
+    schema = get_model_schema(model, mode=mode)
+    return {name: Schema(**value) for name, value in schema.get("$defs", {}).items()}
 
-    # Parse definitions
-    definitions = schema.get("$defs", {})
-    for name, value in definitions.items():
-        components_schemas[name] = Schema(**value)
 
-    return parameters, components_schemas
+# Extra keys of a property schema that are copied to the parameter
+_PARAMETER_EXTRA_KEYS = ("description", "deprecated", "example", "examples")
 
 
-def parse_cookie(cookie: Type[BaseModel]) -> Tuple[List[Parameter], dict]:
-    """Parses a cookie model and returns a list of parameters and component schemas."""
-    schema = get_model_schema(cookie)
+def _parse_parameters_model(
+        model: Type[BaseModel],
+        in_type: ParameterInType,
+        required: Optional[bool] = None
+) -> Tuple[List[Parameter], dict]:
+    """
+    Parses a header, cookie, path or query model and returns a list of parameters and component schemas.
+    The parameters are required when listed in the model's required fields unless `required` is given.
+    """
+    schema = get_model_schema(model)
     parameters = []
     components_schemas: Dict = dict()
     properties = schema.get("properties", {})
+    required_names = set(schema.get("required", ()))
 
     for name, value in properties.items():
         data = {
             "name": name,
-            "in": ParameterInType.COOKIE,
-            "required": name in schema.get("required", []),
+            "in": in_type,
+            "required": name in required_names if required is None else required,
             "schema": Schema(**value)
         }
         # Parse extra values
-        if "description" in value.keys():
-            data["description"] = value.get("description")
-        if "deprecated" in value.keys():
-            data["deprecated"] = value.get("deprecated")
-        if "example" in value.keys():
-            data["example"] = value.get("example")
-        if "examples" in value.keys():
-            data["examples"] = value.get("examples")
-        parameters.append(Parameter(**data))
+        extra = {key: value[key] for key in _PARAMETER_EXTRA_KEYS if key in value}
+        if extra:
+            # Extra values may come from the user's json_schema_extra, validate them
+            parameters.append(Parameter(**data, **extra))
+        else:
+            # Name, in, required and the already validated schema need no validation
+            parameters.append(Parameter.model_construct(**data))
 
     # Parse definitions
-    definitions = schema.get("$defs", {})
-    for name, value in definitions.items():
-        components_schemas[name] = Schema(**value)
+    components_schemas.update(_get_model_definitions(model, "validation"))
 
     return parameters, components_schemas
 
 
-def parse_path(path: Type[BaseModel]) -> Tuple[List[Parameter], dict]:
-    """Parses a path model and returns a list of parameters and component schemas."""
-    schema = get_model_schema(path)
-    parameters = []
-    components_schemas: Dict = dict()
-    properties = schema.get("properties", {})
+# Extra keys of openapi_extra that are copied to the media type
+_MEDIA_TYPE_EXTRA_KEYS = ("example", "examples", "encoding")
 
-    for name, value in properties.items():
-        data = {
-            "name": name,
-            "in": ParameterInType.PATH,
-            "required": True,
-            "schema": Schema(**value)
-        }
-        # Parse extra values
-        if "description" in value.keys():
-            data["description"] = value.get("description")
-        if "deprecated" in value.keys():
-            data["deprecated"] = value.get("deprecated")
-        if "example" in value.keys():
-            data["example"] = value.get("example")
-        if "examples" in value.keys():
-            data["examples"] = value.get("examples")
-        parameters.append(Parameter(**data))
 
-    # Parse definitions
-    definitions = schema.get("$defs", {})
-    for name, value in definitions.items():
-        components_schemas[name] = Schema(**value)
+def _parse_media_type_extra(media_type: MediaType, openapi_extra: Dict[str, Any]) -> None:
+    """Copies the example, examples and encoding of a model's openapi_extra to a media type."""
+    for key in _MEDIA_TYPE_EXTRA_KEYS:
+        if key in openapi_extra:
+            setattr(media_type, key, openapi_extra[key])
 
-    return parameters, components_schemas
 
+def parse_header(header: Type[BaseModel]) -> Tuple[List[Parameter], dict]:
+    """Parses a header model and returns a list of parameters and component schemas."""
+    return _parse_parameters_model(header, ParameterInType.HEADER)
 
-def parse_query(query: Type[BaseModel]) -> Tuple[List[Parameter], dict]:
-    """Parses a query model and returns a list of parameters and component schemas."""
-    schema = get_model_schema(query)
-    parameters = []
-    components_schemas: Dict = dict()
-    properties = schema.get("properties", {})
 
-    for name, value in properties.items():
-        data = {
-            "name": name,
-            "in": ParameterInType.QUERY,
-            "required": name in schema.get("required", []),
-            "schema": Schema(**value)
-        }
-        # Parse extra values
-        if "description" in value.keys():
-            data["description"] = value.get("description")
-        if "deprecated" in value.keys():
-            data["deprecated"] = value.get("deprecated")
-        if "example" in value.keys():
-            data["example"] = value.get("example")
-        if "examples" in value.keys():
-            data["examples"] = value.get("examples")
-        parameters.append(Parameter(**data))
+def parse_cookie(cookie: Type[BaseModel]) -> Tuple[List[Parameter], dict]:
+    """Parses a cookie model and returns a list of parameters and component schemas."""
+    return _parse_parameters_model(cookie, ParameterInType.COOKIE)
 
-    # Parse definitions
-    definitions = schema.get("$defs", {})
-    for name, value in definitions.items():
-        components_schemas[name] = Schema(**value)
 
-    return parameters, components_schemas
+def parse_path(path: Type[BaseModel]) -> Tuple[List[Parameter], dict]:
+    """Parses a path model and returns a list of parameters and component schemas."""
+    return _parse_parameters_model(path, ParameterInType.PATH, required=True)
+
+
+def parse_query(query: Type[BaseModel]) -> Tuple[List[Parameter], dict]:
+    """Parses a query model and returns a list of parameters and component schemas."""
+    return _parse_parameters_model(query, ParameterInType.QUERY)
 
 
 def parse_form(
@@ -289,9 +270,7 @@ def parse_form(
         content["multipart/form-data"].encoding = encoding
 
     # Parse definitions
-    definitions = schema.get("$defs", {})
-    for name, value in definitions.items():
-        components_schemas[name] = Schema(**value)
+    components_schemas.update(_get_model_definitions(form, "validation"))
 
     return content, components_schemas
 
@@ -313,9 +292,7 @@ def parse_body(
     }
 
     # Parse definitions
-    definitions = schema.get("$defs", {})
-    for name, value in definitions.items():
-        components_schemas[name] = Schema(**value)
+    components_schemas.update(_get_model_definitions(body, "validation"))
 
     return content, components_schemas
 
@@ -333,8 +310,8 @@ def get_responses(
             # If the response is None, it means HTTP status code "204" (No Content)
             _responses[key] = Response(description=HTTP_STATUS.get(key, ""))
         elif isinstance(response, dict):
-            response["description"] = response.get("description", HTTP_STATUS.get(key, ""))
-            _responses[key] = Response(**response)
+            # Copy on write: the dict may be shared by the global and per-route responses
+            _responses[key] = Response(**{"description": HTTP_STATUS.get(key, ""), **response})
         else:
             # OpenAPI 3 support ^[a-zA-Z0-9\.\-_]+$ so we should normalize __name__
             schema = get_model_schema(response, mode="serialization")
@@ -348,40 +325,33 @@ def get_responses(
                     )})
 
             model_config: DefaultDict[str, Any] = response.model_config  # type: ignore
-            openapi_extra = model_config.get("openapi_extra", {})
+            openapi_extra = model_config.get("openapi_extra")
             if openapi_extra:
-                openapi_extra_keys = openapi_extra.keys()
                 # Add additional information from model_config to the response
-                if "description" in openapi_extra_keys:
-                    _responses[key].description = openapi_extra.get("description")
-                if "headers" in openapi_extra_keys:
-                    _responses[key].headers = openapi_extra.get("headers")
-                if "links" in openapi_extra_keys:
-                    _responses[key].links = openapi_extra.get("links")
+                if "description" in openapi_extra:
+                    _responses[key].description = openapi_extra["description"]
+                if "headers" in openapi_extra:
+                    _responses[key].headers = openapi_extra["headers"]
+                if "links" in openapi_extra:
+                    _responses[key].links = openapi_extra["links"]
                 _content = _responses[key].content
-                if "example" in openapi_extra_keys:
-                    _content["application/json"].example = openapi_extra.get("example")  # type: ignore
-                if "examples" in openapi_extra_keys:
-                    _content["application/json"].examples = openapi_extra.get("examples")  # type: ignore
-                if "encoding" in openapi_extra_keys:
-                    _content["application/json"].encoding = openapi_extra.get("encoding")  # type: ignore
-                _content.update(openapi_extra.get("content", {}))  # type: ignore
+                _parse_media_type_extra(_content["application/json"], openapi_extra)  # type: ignore
+                if "content" in openapi_extra:
+                    _content.update(openapi_extra["content"])  # type: ignore
 
             _schemas[name] = Schema(**schema)
-            definitions = schema.get("$defs")
-            if definitions:
-                # Add schema definitions to _schemas
-                for name, value in definitions.items():
-                    _schemas[normalize_name(name)] = Schema(**value)
+            # Add schema definitions to _schemas
+            definitions = _get_model_definitions(response, "serialization")
+            _schemas.update((normalize_name(name), value) for name, value in definitions.items())
 
-    components_schemas.update(**_schemas)
+    components_schemas.update(_schemas)
     operation.responses = _responses
 
 
 def parse_and_store_tags(
         new_tags: List[Tag],
         old_tags: List[Tag],
-        old_tag_names: List[str],
+        old_tag_names: Set[str],
         operation: Operation
 ) -> None:
     """
@@ -391,7 +361,7 @@ def parse_and_store_tags(
     Args:
         new_tags: A list of new Tag objects to be parsed and stored.
         old_tags: The list of existing Tag objects.
-        old_tag_names: The list that names of existing tags.
+        old_tag_names: The set of names of existing tags.
         operation: The operation object whose tag attribute needs to be updated.
 
     Returns:
@@ -400,12 +370,43 @@ def parse_and_store_tags(
     # Iterate over each tag in new_tags
     for tag in new_tags:
         if tag.name not in old_tag_names:
-            old_tag_names.append(tag.name)
+            old_tag_names.add(tag.name)
             old_tags.append(tag)
 
-    # Set the tags attribute of the operation object to a list of unique tag names from new_tags
+    # Set the tags attribute of the operation object to the unique tag names, in their original order
     # If the resulting list is empty, set it to ["default"]
-    operation.tags = list(set([tag.name for tag in new_tags])) or ["default"]
+    operation.tags = list(dict.fromkeys(tag.name for tag in new_tags)) or ["default"]
+
+
+def get_parameter_types(func: Callable) -> ParametersTuple:
+    """
+    Returns the types of the header, cookie, path, query, form, body and raw parameters of a function.
+    The result is cached for each function, so the type hints are only resolved once.
+    """
+    try:
+        return _parameter_types_cache[func]
+    except (KeyError, TypeError):
+        pass
+
+    # Get the type hints from the function
+    annotations = get_type_hints(func)
+
+    header: Optional[Type[BaseModel]] = annotations.get("header")
+    cookie: Optional[Type[BaseModel]] = annotations.get("cookie")
+    path: Optional[Type[BaseModel]] = annotations.get("path")
+    query: Optional[Type[BaseModel]] = annotations.get("query")
+    form: Optional[Type[BaseModel]] = annotations.get("form")
+    body: Optional[Type[BaseModel]] = annotations.get("body")
+    raw: Optional[Type[RawModel]] = annotations.get("raw")
+    parameter_types = header, cookie, path, query, form, body, raw
+
+    try:
+        _parameter_types_cache[func] = parameter_types
+    except TypeError:  # pragma: no cover
+        # The callable cannot be weakly referenced
+        pass
+
+    return parameter_types
 
 
 def parse_parameters(
@@ -439,17 +440,8 @@ def parse_parameters(
     if operation is None:
         operation = Operation()
 
-    # Get the type hints from the function
-    annotations = get_type_hints(func)
-
     # Get the types for header, cookie, path, query, form, and body parameters
-    header: Optional[Type[BaseModel]] = annotations.get("header")
-    cookie: Optional[Type[BaseModel]] = annotations.get("cookie")
-    path: Optional[Type[BaseModel]] = annotations.get("path")
-    query: Optional[Type[BaseModel]] = annotations.get("query")
-    form: Optional[Type[BaseModel]] = annotations.get("form")
-    body: Optional[Type[BaseModel]] = annotations.get("body")
-    raw: Optional[Type[RawModel]] = annotations.get("raw")
+    header, cookie, path, query, form, body, raw = get_parameter_types(func)
 
     # If doc_ui is False, return the types without further processing
     if doc_ui is False:
@@ -460,58 +452,46 @@ def parse_parameters(
     if header:
         _parameters, _components_schemas = parse_header(header)
         parameters.extend(_parameters)
-        components_schemas.update(**_components_schemas)
+        components_schemas.update(_components_schemas)
 
     if cookie:
         _parameters, _components_schemas = parse_cookie(cookie)
         parameters.extend(_parameters)
-        components_schemas.update(**_components_schemas)
+        components_schemas.update(_components_schemas)
 
     if path:
         _parameters, _components_schemas = parse_path(path)
         parameters.extend(_parameters)
-        components_schemas.update(**_components_schemas)
+        components_schemas.update(_components_schemas)
 
     if query:
         _parameters, _components_schemas = parse_query(query)
         parameters.extend(_parameters)
-        components_schemas.update(**_components_schemas)
+        components_schemas.update(_components_schemas)
 
     if form:
         _content, _components_schemas = parse_form(form)
-        components_schemas.update(**_components_schemas)
+        components_schemas.update(_components_schemas)
         request_body = RequestBody(content=_content, required=True)
         model_config: DefaultDict[str, Any] = form.model_config  # type: ignore
-        openapi_extra = model_config.get("openapi_extra", {})
+        openapi_extra = model_config.get("openapi_extra")
         if openapi_extra:
-            openapi_extra_keys = openapi_extra.keys()
-            if "description" in openapi_extra_keys:
-                request_body.description = openapi_extra.get("description")
-            if "example" in openapi_extra_keys:
-                request_body.content["multipart/form-data"].example = openapi_extra.get("example")
-            if "examples" in openapi_extra_keys:
-                request_body.content["multipart/form-data"].examples = openapi_extra.get("examples")
-            if "encoding" in openapi_extra_keys:
-                request_body.content["multipart/form-data"].encoding = openapi_extra.get("encoding")
+            if "description" in openapi_extra:
+                request_body.description = openapi_extra["description"]
+            _parse_media_type_extra(request_body.content["multipart/form-data"], openapi_extra)
         operation.requestBody = request_body
 
     if body:
         _content, _components_schemas = parse_body(body)
-        components_schemas.update(**_components_schemas)
+        components_schemas.update(_components_schemas)
         request_body = RequestBody(content=_content, required=True)
         model_config: DefaultDict[str, Any] = body.model_config  # type: ignore
-        openapi_extra = model_config.get("openapi_extra", {})
+        openapi_extra = model_config.get("openapi_extra")
         if openapi_extra:
-            openapi_extra_keys = openapi_extra.keys()
-            if "description" in openapi_extra_keys:
-                request_body.description = openapi_extra.get("description")
+            if "description" in openapi_extra:
+                request_body.description = openapi_extra["description"]
             request_body.required = openapi_extra.get("required", True)
-            if "example" in openapi_extra_keys:
-                request_body.content["application/json"].example = openapi_extra.get("example")
-            if "examples" in openapi_extra_keys:
-                request_body.content["application/json"].examples = openapi_extra.get("examples")
-            if "encoding" in openapi_extra_keys:
-                request_body.content["application/json"].encoding = openapi_extra.get("encoding")
+            _parse_media_type_extra(request_body.content["application/json"], openapi_extra)
         operation.requestBody = request_body
 
     if raw:
@@ -548,32 +528,16 @@ def parse_method(uri: str, method: str, paths: dict, operation: Operation) -> No
     Returns:
         None
     """
-    # Check the HTTP method and update the PathItem object in the path dictionary
-    if method == HTTPMethod.GET:
-        if not paths.get(uri):
-            paths[uri] = PathItem(get=operation)
-        else:
-            paths[uri].get = operation
-    elif method == HTTPMethod.POST:
-        if not paths.get(uri):
-            paths[uri] = PathItem(post=operation)
-        else:
-            paths[uri].post = operation
-    elif method == HTTPMethod.PUT:
-        if not paths.get(uri):
-            paths[uri] = PathItem(put=operation)
-        else:
-            paths[uri].put = operation
-    elif method == HTTPMethod.PATCH:
-        if not paths.get(uri):
-            paths[uri] = PathItem(patch=operation)
-        else:
-            paths[uri].patch = operation
-    elif method == HTTPMethod.DELETE:
-        if not paths.get(uri):
-            paths[uri] = PathItem(delete=operation)
-        else:
-            paths[uri].delete = operation
+    # Update the PathItem object in the path dictionary with the attribute of the HTTP method
+    attr = _PATH_ITEM_METHOD_ATTRS.get(method)
+    if attr is None:
+        return
+
+    path_item = paths.get(uri)
+    if path_item is None:
+        paths[uri] = PathItem(**{attr: operation})
+    else:
+        setattr(path_item, attr, operation)
 
 
 def make_validation_error_response(e: ValidationError) -> FlaskResponse:
@@ -602,16 +566,30 @@ def parse_rule(rule: str, url_prefix=None) -> str:
         uri = uri.rstrip("/")
 
     # Convert a route parameter format from /pet/<petId> to /pet/{petId}
-    uri = re.sub(r"<([^<:]+:)?", "{", uri).replace(">", "}")
+    if "<" in uri:
+        if ":" in uri:
+            # Strip converters such as <int:petId>
+            uri = _RULE_PARAM_RE.sub("{", uri)
+        else:
+            uri = uri.replace("<", "{")
+        uri = uri.replace(">", "}")
 
-    return uri
+    # The uri is used as a key of the paths dictionary
+    return sys.intern(uri)
 
 
 def convert_responses_key_to_string(responses: ResponseDict) -> ResponseStrKeyDict:
     """Convert key to string"""
+    # Responses written with string status codes can be used as they are
+    if all(type(key) is str for key in responses):
+        return responses  # type: ignore
 
     return {str(key.value if isinstance(key, HTTPStatus) else key): value for key, value in responses.items()}
 
 
+@lru_cache(maxsize=1024)
 def normalize_name(name: str) -> str:
-    return re.sub(r"[^\w.\-]", "_", name)
+    # Plain ASCII identifiers like "User" or "Pet123" have nothing to replace
+    if name.isascii() and name.isidentifier():
+        return name
+    return _INVALID_NAME_CHAR_RE.sub("_", name)
@@ -2,7 +2,7 @@
 # @Author  : llc
 # @Time    : 2022/10/14 16:09
 import typing
-from typing import Optional, List, Dict, Any, Callable
+from typing import Optional, List, Dict, Any, Callable, Set
 
 from .models import ExternalDocumentation
 from .models import Server
@@ -59,7 +59,7 @@ class APIView:
         self.paths: Dict = dict()
         self.components_schemas: Dict = dict()
         self.tags: List[Tag] = []
-        self.tag_names: List[str] = []
+        self.tag_names: Set[str] = set()
 
     def route(self, rule: str):
         """Decorator for view class"""
@@ -140,8 +140,11 @@ class APIView:
             if self.doc_ui is False or doc_ui is False:
                 return func
 
-            # Global response combines API responses
-            combine_responses = {**self.view_responses, **new_responses}
+            # Global response combines API responses, the global ones are shared when there is nothing to add
+            if new_responses:
+                combine_responses = {**self.view_responses, **new_responses}
+            else:
+                combine_responses = self.view_responses
 
             # Create operation
             operation = get_operation(
@@ -571,3 +571,62 @@ def test_prefix_items(request):
  'required': ['my_tuple'],
  'title': 'TupleModel',
  'type': 'object'}
+
+
+def test_api_doc_rebuilt_after_new_route(request):
+    test_app = OpenAPI(request.node.name)
+    test_app.config["TESTING"] = True
+
+    @test_app.get("/first")
+    def first():
+        pass  # pragma: no cover
+
+    assert list(test_app.api_doc["paths"]) == ["/first"]
+    assert test_app.api_doc is test_app.api_doc
+
+    @test_app.get("/second")
+    def second():
+        pass  # pragma: no cover
+
+    assert list(test_app.api_doc["paths"]) == ["/first", "/second"]
+
+
+def test_validation_error_schemas_not_shared(request):
+    first_app = OpenAPI(request.node.name + "_first")
+    first_app.api_doc["components"]["schemas"]["ValidationErrorModel"]["x-internal"] = True
+
+    second_app = OpenAPI(request.node.name + "_second")
+    assert "x-internal" not in second_app.api_doc["components"]["schemas"]["ValidationErrorModel"]
+
+
+def test_validation_error_reassigned(request):
+    test_app = OpenAPI(request.node.name)
+
+    class CustomValidationError(BaseModel):
+        msg: str
+
+    @test_app.get("/book")
+    def get_book(query: QueryParam):
+        pass  # pragma: no cover
+
+    test_app.validation_error_model = CustomValidationError
+    test_app.validation_error_status = "400"
+    api_doc = test_app.api_doc
+    assert "CustomValidationError" in api_doc["components"]["schemas"]
+    validation_error_response = api_doc["paths"]["/book"]["get"]["responses"]["400"]
+    assert validation_error_response["description"] == "Bad Request"
+    items = validation_error_response["content"]["application/json"]["schema"]["items"]
+    assert items == {"$ref": "#/components/schemas/CustomValidationError"}
+
+
+def test_openapi_html_string(request):
+    test_app = OpenAPI(request.node.name)
+    test_app.config["TESTING"] = True
+    client = test_app.test_client()
+
+    resp = client.get("/openapi/")
+    assert resp.status_code == 200
+    assert client.get("/openapi/").data == resp.data
+
+    test_app.config["OPENAPI_HTML_STRING"] = "<p>{{ request.path }}</p>"
+    assert client.get("/openapi/").data == b"<p>/openapi/</p>"
@@ -40,6 +40,17 @@ def create_book():
     return 'api_book'
 
 
+def disable_automatic_options(func):
+    func.provide_automatic_options = False
+    return func
+
+
+@app.get('/book/no-options')
+@disable_automatic_options
+def get_book_without_options():
+    return 'app_book'
+
+
 # register api
 app.register_api(api)
 
@@ -64,3 +75,12 @@ def test_post(client):
 
     assert resp.text == 'api_book'
     assert '/book.endpoint_post_book' in app.view_functions.keys()
+
+
+def test_view_func_attributes(client):
+    # Attributes of the view function such as provide_automatic_options are read by Flask's add_url_rule
+    resp = client.options("/book")
+    assert resp.status_code == 200
+
+    resp = client.options("/book/no-options")
+    assert resp.status_code == 405
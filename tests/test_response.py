@@ -60,3 +60,15 @@ def test_openapi(client):
     assert resp.status_code == 200
     assert _json["paths"]["/book/{bid}"]["get"]["responses"].keys() - ["200", "201", "202", "204"] == {"422"}
     assert _json["paths"]["/api/book"]["get"]["responses"].keys() - ["200", "201", "202", "204"] == set()
+
+
+def test_dict_response_not_mutated():
+    _responses = {"202": {"content": {"text/html": {"schema": {"type": "string"}}}}}
+    _app = OpenAPI(__name__, responses=_responses)
+
+    @_app.get("/book")
+    def get_book():
+        pass  # pragma: no cover
+
+    assert "description" not in _responses["202"]
+    assert _app.api_doc["paths"]["/book"]["get"]["responses"]["202"]["description"] == "Accepted"
@@ -1,9 +1,10 @@
 # -*- coding: utf-8 -*-
 # @Author  : llc
 # @Time    : 2024/11/10 12:17
+import pytest
 from pydantic import ValidationError
 
-from flask_openapi3 import Server, ServerVariable
+from flask_openapi3 import OpenAPI, Server, ServerVariable
 
 
 def test_server_variable():
@@ -41,3 +42,12 @@ def test_server_variable():
     except ValidationError:
         error = 1
     assert error == 0
+
+
+def test_servers():
+    servers = [Server(url="http://127.0.0.1:5000")]
+    app = OpenAPI(__name__, servers=servers)
+
+    assert app.api_doc["servers"] == [{"url": "http://127.0.0.1:5000"}]
+    with pytest.deprecated_call():
+        assert app.severs is app.servers
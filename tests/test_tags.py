@@ -49,3 +49,14 @@ def test_openapi(client):
         if tag not in news_tags:
             news_tags.append(tag)
     assert news_tags == tags
+
+
+def test_operation_tags_keep_order():
+    _app = OpenAPI(__name__)
+
+    @_app.get("/book", tags=[Tag(name="b"), Tag(name="a"), Tag(name="b"), Tag(name="c")])
+    def get_book():
+        ...  # pragma: no cover
+
+    assert _app.api_doc["paths"]["/book"]["get"]["tags"] == ["b", "a", "c"]
+    assert [tag["name"] for tag in _app.api_doc["tags"]] == ["b", "a", "c"]
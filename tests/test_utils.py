@@ -2,8 +2,93 @@
 # @Author  : llc
 # @Time    : 2022/12/19 10:34
 
+from http import HTTPStatus
+
+from pydantic import BaseModel, Field
+
+from flask_openapi3.models import Operation
+from flask_openapi3.utils import HTTPMethod
+from flask_openapi3.utils import convert_responses_key_to_string
+from flask_openapi3.utils import get_operation
+from flask_openapi3.utils import get_parameter_types
 from flask_openapi3.utils import normalize_name
+from flask_openapi3.utils import parse_method
+from flask_openapi3.utils import parse_query
+from flask_openapi3.utils import parse_rule
 
 
 def test_normalize_name():
     assert "List-Generic.Response_Detail_" == normalize_name("List-Generic.Response[Detail]")
+    assert "BookModel" == normalize_name("BookModel")
+    assert "Book_Model" == normalize_name("Book Model")
+
+
+def test_parse_rule():
+    assert "/book" == parse_rule("/book")
+    assert "/book/{bid}" == parse_rule("/book/<bid>")
+    assert "/book/{bid}/{name}" == parse_rule("/book/<bid>/<name>")
+    assert "/api/book/{bid}/{name}" == parse_rule("/book/<int:bid>/<string(length=2):name>", url_prefix="/api")
+
+
+def test_convert_responses_key_to_string():
+    responses = {"200": None, "404": None}
+    assert convert_responses_key_to_string(responses) is responses
+    assert {"200": None, "404": None} == convert_responses_key_to_string({HTTPStatus.OK: None, 404: None})
+
+
+def test_get_parameter_types():
+    class Query(BaseModel):
+        page: int
+
+    def view(query: Query):
+        pass  # pragma: no cover
+
+    parameter_types = get_parameter_types(view)
+    assert parameter_types == (None, None, None, Query, None, None, None)
+    assert get_parameter_types(view) is parameter_types
+
+
+def test_get_operation():
+    def view():
+        """Get a book
+        to get some book by id
+        """
+
+    def view_without_doc():
+        pass  # pragma: no cover
+
+    operation = get_operation(view)
+    assert operation.summary == "Get a book"
+    assert operation.description == "to get some book by id"
+
+    operation = get_operation(view, summary="summary", description="description")
+    assert operation.summary == "summary"
+    assert operation.description == "description"
+
+    operation = get_operation(view_without_doc)
+    assert operation.summary is None
+    assert operation.description is None
+
+
+def test_parse_method():
+    paths: dict = {}
+    get_book, create_book = Operation(summary="get"), Operation(summary="post")
+    # Both HTTPMethod members and plain method strings are accepted
+    parse_method("/book", HTTPMethod.GET, paths, get_book)
+    parse_method("/book", "POST", paths, create_book)
+    parse_method("/book", "HEAD", paths, Operation())
+    assert paths["/book"].get is get_book
+    assert paths["/book"].post is create_book
+    assert paths["/book"].head is None
+
+
+def test_parse_query():
+    class Query(BaseModel):
+        page: int = 1
+        size: int = Field(10, json_schema_extra={"deprecated": "yes"})
+
+    parameters, _ = parse_query(Query)
+    assert [p.name for p in parameters] == ["page", "size"]
+    assert parameters[0].deprecated is None
+    # Extra values from json_schema_extra are still validated
+    assert parameters[1].deprecated is True